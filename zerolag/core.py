@@ -1,18 +1,29 @@
 from __future__ import annotations
 
+import heapq
 import os
 import sys
+import threading
 import platform
 import time
 import json
-from typing import Any, Dict, List
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import psutil
 
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+
 from .scoring import score_system
 
 IS_WINDOWS = os.name == "nt"
 
+# Minimum time between priming and reading cpu_percent() during a scan.
+_CPU_SAMPLE_WINDOW = 0.6
+
 
 def _bytes_gb(n: float) -> float:
     return round(n / (1024 ** 3), 2)
@@ -29,6 +40,30 @@ def _safe_get(fn, default=None):
         return default
 
 
+# (scope, path) -> (last-write time, items); Run keys rarely change between scans.
+_STARTUP_CACHE: Dict[Tuple[str, str], Tuple[int, List[Dict[str, str]]]] = {}
+
+
+def _read_run_key(winreg, scope: str, root, path: str) -> List[Dict[str, str]]:
+    try:
+        with winreg.OpenKey(root, path) as key:
+            _, num_values, stamp = winreg.QueryInfoKey(key)
+            cached = _STARTUP_CACHE.get((scope, path))
+            if cached and cached[0] == stamp:
+                return list(cached[1])
+            items: List[Dict[str, str]] = []
+            for i in range(num_values):
+                try:
+                    name, value, _ = winreg.EnumValue(key, i)
+                except OSError:
+                    break  # value removed since QueryInfoKey; keep what was read
+                items.append({"scope": scope, "name": str(name), "command": str(value)})
+            _STARTUP_CACHE[(scope, path)] = (stamp, items)
+            return list(items)
+    except Exception:
+        return []
+
+
 def _read_startup_items_windows() -> List[Dict[str, str]]:
     """Read common Windows startup entries from registry."""
     items: List[Dict[str, str]] = []
@@ -46,28 +81,70 @@ def _read_startup_items_windows() -> List[Dict[str, str]]:
         ("HKLM", winreg.HKEY_LOCAL_MACHINE, r"Software\Wow6432Node\Microsoft\Windows\CurrentVersion\Run"),
     ]
 
-    for scope, root, path in locations:
-        try:
-            with winreg.OpenKey(root, path) as key:
-                i = 0
-                while True:
-                    try:
-                        name, value, _ = winreg.EnumValue(key, i)
-                        items.append({"scope": scope, "name": str(name), "command": str(value)})
-                        i += 1
-                    except OSError:
-                        break
-        except Exception:
-            continue
+    with ThreadPoolExecutor(max_workers=len(locations)) as ex:
+        for found in ex.map(lambda loc: _read_run_key(winreg, *loc), locations):
+            items.extend(found)
     return items
 
 
+# Mount list reused across UI rescans; usage is still polled every scan.
+_PARTITIONS_TTL = 60.0
+_partitions_cache: Tuple[float, List[Any]] = (0.0, [])
+
+_DISK_USAGE_TIMEOUT = 2.0
+# Mountpoints whose disk_usage() call from an earlier scan hasn't returned yet.
+_disk_usage_pending: Set[str] = set()
+_disk_usage_lock = threading.Lock()
+
+
+def _disk_partitions() -> List[Any]:
+    global _partitions_cache
+    stamp, parts = _partitions_cache
+    now = time.monotonic()
+    if not parts or now - stamp > _PARTITIONS_TTL:
+        parts = psutil.disk_partitions(all=False)
+        _partitions_cache = (now, parts)
+    return parts
+
+
+def _disk_usage_async(mountpoint: str) -> Future:
+    """Run disk_usage() on a daemon thread so a hung mount can't block exit."""
+    fut: Future = Future()
+
+    def task():
+        try:
+            fut.set_result(psutil.disk_usage(mountpoint))
+        except Exception as e:
+            fut.set_exception(e)
+        finally:
+            with _disk_usage_lock:
+                _disk_usage_pending.discard(mountpoint)
+
+    threading.Thread(target=task, daemon=True).start()
+    return fut
+
+
 def _disk_summary() -> List[Dict[str, Any]]:
     disks: List[Dict[str, Any]] = []
-    for part in psutil.disk_partitions(all=False):
-        if "cdrom" in part.opts.lower():
+    parts = [part for part in _disk_partitions() if "cdrom" not in part.opts.lower()]
+    if not parts:
+        return disks
+
+    # Query mounts concurrently; a hung network drive is skipped after the
+    # timeout, and isn't queried again until its earlier call returns.
+    futures: Dict[str, Future] = {}
+    with _disk_usage_lock:
+        for part in parts:
+            if part.mountpoint not in _disk_usage_pending:
+                _disk_usage_pending.add(part.mountpoint)
+                futures[part.mountpoint] = _disk_usage_async(part.mountpoint)
+    wait(futures.values(), timeout=_DISK_USAGE_TIMEOUT)
+
+    for part in parts:
+        fut = futures.get(part.mountpoint)
+        if fut is None or not fut.done():
             continue
-        usage = _safe_get(lambda: psutil.disk_usage(part.mountpoint))
+        usage = _safe_get(fut.result)
         if not usage:
             continue
         disks.append(
@@ -84,36 +161,67 @@ def _disk_summary() -> List[Dict[str, Any]]:
     return disks
 
 
-def _top_processes(limit: int = 10) -> List[Dict[str, Any]]:
-    procs: List[Dict[str, Any]] = []
-    for p in psutil.process_iter(attrs=["pid", "name"]):
+def _seed_processes() -> Tuple[Dict[int, psutil.Process], float]:
+    """Create a handle per PID and prime its cpu_percent() baseline.
+
+    Also returns the monotonic time seeding finished, so callers can give the
+    last-primed PID a full sample window.
+    """
+    seed: Dict[int, psutil.Process] = {}
+    for pid in psutil.pids():
+        try:
+            p = psutil.Process(pid)
+            p.cpu_percent(interval=0.0)
+            seed[pid] = p
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return seed, time.monotonic()
+
+
+def _top_processes(seed: Dict[int, psutil.Process], limit: int = 10) -> List[Dict[str, Any]]:
+    """Read CPU deltas and memory from seeded handles; exited PIDs are skipped."""
+    # Raw (cpu_pct, rss, pid, name) rows; only the winners are converted to dicts/GB.
+    rows: List[Tuple[float, int, int, str]] = []
+    for pid, p in seed.items():
         try:
             with p.oneshot():
-                cpu = p.cpu_percent(interval=0.0)
-                mem = p.memory_info().rss
-                procs.append(
-                    {
-                        "pid": p.info.get("pid"),
-                        "name": p.info.get("name"),
-                        "cpu_pct": cpu,
-                        "ram_gb": _bytes_gb(mem),
-                    }
-                )
-        except Exception:
+                rows.append((p.cpu_percent(interval=0.0), p.memory_info().rss, pid, p.name()))
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
             continue
-    procs.sort(key=lambda x: (x.get("cpu_pct") or 0, x.get("ram_gb") or 0), reverse=True)
-    return procs[:limit]
+    top = heapq.nlargest(limit, rows, key=lambda r: (r[0], r[1]))
+    return [{"pid": pid, "name": name, "cpu_pct": cpu, "ram_gb": _bytes_gb(rss)} for cpu, rss, pid, name in top]
 
 
-def _cpu_snapshot() -> Dict[str, Any]:
-    cpu_pct = psutil.cpu_percent(interval=0.6)
+_CPU0_FREQ_DIR = "/sys/devices/system/cpu/cpu0/cpufreq"
+
+
+def _cpu_freq() -> Optional[Tuple[float, float]]:
+    """Return (current_mhz, max_mhz).
+
+    On Linux psutil.cpu_freq() reads every core's sysfs entry, which can take
+    seconds on many-core hosts; cpu0 alone is enough for a snapshot.
+    """
+    if sys.platform.startswith("linux"):
+        try:
+            with open(os.path.join(_CPU0_FREQ_DIR, "scaling_cur_freq")) as f:
+                current = int(f.read()) / 1000
+            with open(os.path.join(_CPU0_FREQ_DIR, "scaling_max_freq")) as f:
+                max_ = int(f.read()) / 1000
+            return current, max_
+        except (OSError, ValueError):
+            pass
     freq = _safe_get(lambda: psutil.cpu_freq())
+    return (freq.current, freq.max) if freq else None
+
+
+def _cpu_snapshot(cpu_pct: float) -> Dict[str, Any]:
+    freq = _cpu_freq()
     return {
         "cpu_pct": cpu_pct,
         "physical_cores": psutil.cpu_count(logical=False),
         "logical_cores": psutil.cpu_count(logical=True),
-        "max_mhz": round(freq.max, 0) if freq else None,
-        "current_mhz": round(freq.current, 0) if freq else None,
+        "max_mhz": round(freq[1], 0) if freq else None,
+        "current_mhz": round(freq[0], 0) if freq else None,
     }
 
 
@@ -139,7 +247,10 @@ def _system_info() -> Dict[str, Any]:
 
 
 def _recommendations(data: Dict[str, Any], mode: str) -> List[Dict[str, Any]]:
-    recs: List[Dict[str, Any]] = []
+    # Bucketed by priority; concatenation keeps append order within each level.
+    high: List[Dict[str, Any]] = []
+    med: List[Dict[str, Any]] = []
+    low: List[Dict[str, Any]] = []
     gaming = (mode or "general").lower() == "gaming"
 
     # Disk free space warnings (gaming expects more space)
@@ -150,7 +261,7 @@ def _recommendations(data: Dict[str, Any], mode: str) -> List[Dict[str, Any]]:
         free_pct = d.get("free_pct")
         mp = d.get("mountpoint")
         if free_pct is not None and free_pct < bad:
-            recs.append(
+            high.append(
                 {
                     "priority": "High",
                     "title": f"Low free space on {mp}",
@@ -159,7 +270,7 @@ def _recommendations(data: Dict[str, Any], mode: str) -> List[Dict[str, Any]]:
                 }
             )
         elif free_pct is not None and free_pct < warn:
-            recs.append(
+            med.append(
                 {
                     "priority": "Medium",
                     "title": f"Free space getting tight on {mp}",
@@ -173,7 +284,7 @@ def _recommendations(data: Dict[str, Any], mode: str) -> List[Dict[str, Any]]:
     ram_warn = 70 if not gaming else 60
     ram_bad = 85 if not gaming else 75
     if used_pct is not None and used_pct >= ram_bad:
-        recs.append(
+        high.append(
             {
                 "priority": "High",
                 "title": "High RAM usage",
@@ -182,7 +293,7 @@ def _recommendations(data: Dict[str, Any], mode: str) -> List[Dict[str, Any]]:
             }
         )
     elif used_pct is not None and used_pct >= ram_warn:
-        recs.append(
+        med.append(
             {
                 "priority": "Medium",
                 "title": "RAM pressure",
@@ -196,7 +307,7 @@ def _recommendations(data: Dict[str, Any], mode: str) -> List[Dict[str, Any]]:
     s_warn = 7 if not gaming else 6
     s_bad = 12 if not gaming else 10
     if len(startup) >= s_bad:
-        recs.append(
+        high.append(
             {
                 "priority": "High",
                 "title": "Many startup items",
@@ -205,7 +316,7 @@ def _recommendations(data: Dict[str, Any], mode: str) -> List[Dict[str, Any]]:
             }
         )
     elif len(startup) >= s_warn:
-        recs.append(
+        med.append(
             {
                 "priority": "Medium",
                 "title": "Several startup items",
@@ -219,7 +330,7 @@ def _recommendations(data: Dict[str, Any], mode: str) -> List[Dict[str, Any]]:
     c_warn = 60 if not gaming else 50
     c_bad = 85 if not gaming else 75
     if cpu_pct is not None and cpu_pct >= c_bad:
-        recs.append(
+        high.append(
             {
                 "priority": "High",
                 "title": "High CPU usage at scan time",
@@ -228,7 +339,7 @@ def _recommendations(data: Dict[str, Any], mode: str) -> List[Dict[str, Any]]:
             }
         )
     elif cpu_pct is not None and cpu_pct >= c_warn:
-        recs.append(
+        low.append(
             {
                 "priority": "Low",
                 "title": "CPU moderately loaded",
@@ -239,7 +350,7 @@ def _recommendations(data: Dict[str, Any], mode: str) -> List[Dict[str, Any]]:
 
     # Gamer tips (safe)
     if gaming:
-        recs.append(
+        low.append(
             {
                 "priority": "Low",
                 "title": "Gaming mode checklist",
@@ -249,7 +360,7 @@ def _recommendations(data: Dict[str, Any], mode: str) -> List[Dict[str, Any]]:
         )
 
     # Safe defaults
-    recs.append(
+    low.append(
         {
             "priority": "Low",
             "title": "Keep drivers and Windows updated",
@@ -257,7 +368,7 @@ def _recommendations(data: Dict[str, Any], mode: str) -> List[Dict[str, Any]]:
             "action": "Update GPU drivers from official vendor, and run Windows Update regularly.",
         }
     )
-    recs.append(
+    low.append(
         {
             "priority": "Low",
             "title": "Storage hygiene",
@@ -266,9 +377,7 @@ def _recommendations(data: Dict[str, Any], mode: str) -> List[Dict[str, Any]]:
         }
     )
 
-    order = {"High": 0, "Medium": 1, "Low": 2}
-    recs.sort(key=lambda r: order.get(r.get("priority", "Low"), 9))
-    return recs
+    return high + med + low
 
 
 def run_scan(mode: str = "general") -> Dict[str, Any]:
@@ -276,22 +385,41 @@ def run_scan(mode: str = "general") -> Dict[str, Any]:
     data: Dict[str, Any] = {}
     data["mode"] = (mode or "general").lower().strip()
     data["system"] = _system_info()
-    data["cpu"] = _cpu_snapshot()
-    data["ram"] = _ram_snapshot()
-    data["disks"] = _disk_summary()
 
-    # seed CPU% then snapshot
-    _ = _top_processes(limit=16)
-    time.sleep(0.6)
-    data["top_processes"] = _top_processes(limit=10)
+    # System and per-process CPU share one sample window: prime both, run the
+    # disk/registry work inside it, then read the deltas.
+    psutil.cpu_percent(interval=None)
+    window_start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        disks_f = ex.submit(_disk_summary)
+        startup_f = ex.submit(_read_startup_items_windows)
+        seed_f = ex.submit(_seed_processes)
+        disks = disks_f.result()
+        startup = startup_f.result()
+        seed, seed_done = seed_f.result()
+
+    # Every PID is primed no later than seed_done, so this gives each one
+    # (and the system-wide counter) at least a full window.
+    remaining = max(window_start, seed_done) + _CPU_SAMPLE_WINDOW - time.monotonic()
+    if remaining > 0:
+        time.sleep(remaining)
+
+    data["cpu"] = _cpu_snapshot(psutil.cpu_percent(interval=None))
+    data["ram"] = _ram_snapshot()
+    data["disks"] = disks
+    data["top_processes"] = _top_processes(seed, limit=10)
+    data["startup_items"] = startup
 
-    data["startup_items"] = _read_startup_items_windows()
     data["score"] = score_system(data, mode=data["mode"])
     data["recommendations"] = _recommendations(data, mode=data["mode"])
     return data
 
 
 def save_json(data: Dict[str, Any], path: str) -> None:
-    os.makedirs(os.path.dirname(path), exist_ok=True)
+    """Write scan data to path; the parent directory must already exist."""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
     with open(path, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2, ensure_ascii=False)
@@ -1,16 +1,42 @@
 from __future__ import annotations
 
-import os
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterable, List, Tuple
 
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.units import cm
-from reportlab.lib import colors
-from reportlab.pdfgen import canvas
+
+_MD_ESCAPE = str.maketrans({"|": "\\|"})
+
+_SNAPSHOT_HEADER = ("| Metric | Value |", "|---|---|")
 
 
 def _md_escape(s: str) -> str:
-    return s.replace("|", "\\|")
+    return s.translate(_MD_ESCAPE)
+
+
+# Table templates: (header lines, row formatter), built once at import.
+_TableTpl = Tuple[Tuple[str, ...], Callable[[Dict[str, Any]], str]]
+
+_BREAKDOWN_TABLE: _TableTpl = (
+    ("| Area | Penalty | Reason |", "|---|---:|---|"),
+    lambda b: f"| {b['tag']} | {b['penalty']} | {_md_escape(b['reason'])} |",
+)
+_DISKS_TABLE: _TableTpl = (
+    ("| Mount | Total (GB) | Free (GB) | Free (%) | FS |", "|---|---:|---:|---:|---|"),
+    lambda d: f"| {d['mountpoint']} | {d['total_gb']} | {d['free_gb']} | {d['free_pct']} | {d['fstype']} |",
+)
+_STARTUP_TABLE: _TableTpl = (
+    ("| Scope | Name | Command |", "|---|---|---|"),
+    lambda s: f"| {s['scope']} | {_md_escape(s['name'])} | {_md_escape(s['command'])} |",
+)
+_PROCS_TABLE: _TableTpl = (
+    ("| Process | CPU (%) | RAM (GB) | PID |", "|---|---:|---:|---:|"),
+    lambda p: f"| {_md_escape(str(p['name']))} | {p['cpu_pct']} | {p['ram_gb']} | {p['pid']} |",
+)
+
+
+def _table(lines: List[str], tpl: _TableTpl, items: Iterable[Dict[str, Any]]) -> None:
+    header, fmt = tpl
+    lines.extend(header)
+    lines.extend(map(fmt, items))
 
 
 def render_markdown(data: Dict[str, Any]) -> str:
@@ -40,18 +66,14 @@ def render_markdown(data: Dict[str, Any]) -> str:
     lines.append("")
     bd = score.get("breakdown") or []
     if bd:
-        lines.append("| Area | Penalty | Reason |")
-        lines.append("|---|---:|---|")
-        for b in bd:
-            lines.append(f"| {b.get('tag','')} | {b.get('penalty','')} | {_md_escape(b.get('reason',''))} |")
+        _table(lines, _BREAKDOWN_TABLE, bd)
     else:
         lines.append("_No major issues detected by the heuristic scoring._")
     lines.append("")
 
     lines.append("## Snapshot")
     lines.append("")
-    lines.append("| Metric | Value |")
-    lines.append("|---|---|")
+    lines.extend(_SNAPSHOT_HEADER)
     lines.append(f"| CPU load (scan time) | {cpu.get('cpu_pct','?')}% |")
     lines.append(f"| RAM used | {ram.get('used_pct','?')}% |")
     lines.append(f"| RAM total | {ram.get('total_gb','?')} GB |")
@@ -64,12 +86,7 @@ def render_markdown(data: Dict[str, Any]) -> str:
     lines.append("## Storage")
     lines.append("")
     if disks:
-        lines.append("| Mount | Total (GB) | Free (GB) | Free (%) | FS |")
-        lines.append("|---|---:|---:|---:|---|")
-        for d in disks:
-            lines.append(
-                f"| {d.get('mountpoint','')} | {d.get('total_gb','')} | {d.get('free_gb','')} | {d.get('free_pct','')} | {d.get('fstype','')} |"
-            )
+        _table(lines, _DISKS_TABLE, disks)
         lines.append("")
     else:
         lines.append("_No disk info available._\n")
@@ -79,10 +96,7 @@ def render_markdown(data: Dict[str, Any]) -> str:
     lines.append(f"Total items found: **{len(startup)}**")
     if startup:
         lines.append("")
-        lines.append("| Scope | Name | Command |")
-        lines.append("|---|---|---|")
-        for s in startup[:20]:
-            lines.append(f"| {s.get('scope','')} | {_md_escape(s.get('name',''))} | {_md_escape(s.get('command',''))} |")
+        _table(lines, _STARTUP_TABLE, startup[:20])
         if len(startup) > 20:
             lines.append("")
             lines.append(f"_Showing first 20 of {len(startup)} items._")
@@ -91,10 +105,7 @@ def render_markdown(data: Dict[str, Any]) -> str:
     lines.append("## Top processes (snapshot)")
     lines.append("")
     if procs:
-        lines.append("| Process | CPU (%) | RAM (GB) | PID |")
-        lines.append("|---|---:|---:|---:|")
-        for p in procs:
-            lines.append(f"| {_md_escape(str(p.get('name','')))} | {p.get('cpu_pct','')} | {p.get('ram_gb','')} | {p.get('pid','')} |")
+        _table(lines, _PROCS_TABLE, procs)
     else:
         lines.append("_No process info available._")
     lines.append("")
@@ -110,12 +121,14 @@ def render_markdown(data: Dict[str, Any]) -> str:
 
 
 def save_markdown(md: str, path: str) -> None:
-    os.makedirs(os.path.dirname(path), exist_ok=True)
+    """Write the report to path; the parent directory must already exist."""
     with open(path, "w", encoding="utf-8") as f:
         f.write(md)
 
 
 def _priority_color(priority: str):
+    from reportlab.lib import colors
+
     p = (priority or "low").lower()
     if p == "high":
         return colors.HexColor("#D64541")  # red-ish
@@ -125,7 +138,13 @@ def _priority_color(priority: str):
 
 
 def render_pdf(data: Dict[str, Any], path: str) -> None:
-    os.makedirs(os.path.dirname(path), exist_ok=True)
+    """Draw the PDF report to path; the parent directory must already exist."""
+    # reportlab is imported here so Markdown/JSON-only callers don't pay for it.
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import cm
+    from reportlab.lib import colors
+    from reportlab.pdfgen import canvas
+
     c = canvas.Canvas(path, pagesize=A4)
     w, h = A4
     x = 2 * cm
@@ -139,15 +158,35 @@ def render_pdf(data: Dict[str, Any], path: str) -> None:
     procs = data.get("top_processes", [])
     score = data.get("score") or {}
 
+    # Font/fill state is tracked so repeated body lines don't re-emit it;
+    # showPage() resets the canvas graphics state, so the trackers reset too.
+    cur_font = None
+    cur_fill = None
+
+    def set_font(font: str, size: float):
+        nonlocal cur_font
+        if cur_font != (font, size):
+            c.setFont(font, size)
+            cur_font = (font, size)
+
+    def set_fill(color):
+        nonlocal cur_fill
+        if cur_fill != color:
+            c.setFillColor(color)
+            cur_fill = color
+
     def newpage_if_needed(min_y=2*cm):
-        nonlocal y
+        nonlocal y, cur_font, cur_fill
         if y < min_y:
             c.showPage()
             y = h - 2 * cm
+            cur_font = None
+            cur_fill = None
 
     def line(txt: str, dy: float = 14, font="Helvetica", size=10):
         nonlocal y
-        c.setFont(font, size)
+        set_fill(colors.black)
+        set_font(font, size)
         c.drawString(x, y, txt)
         y -= dy
         newpage_if_needed()
@@ -156,12 +195,11 @@ def render_pdf(data: Dict[str, Any], path: str) -> None:
         nonlocal y
         bw = 7.0 * cm
         bh = 0.6 * cm
-        c.setFillColor(color)
+        set_fill(color)
         c.roundRect(x, y - bh + 3, bw, bh, 6, stroke=0, fill=1)
-        c.setFillColor(colors.white)
-        c.setFont("Helvetica-Bold", 10)
+        set_fill(colors.white)
+        set_font("Helvetica-Bold", 10)
         c.drawString(x + 8, y - bh + 8, text)
-        c.setFillColor(colors.black)
         y -= (bh + 10)
         newpage_if_needed()
 
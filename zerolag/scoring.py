@@ -1,11 +1,110 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Tuple, List
+from typing import Any, Callable, Dict, Tuple, List
 
 PRIORITY_ORDER = {"High": 0, "Medium": 1, "Low": 2}
 
-def clamp(n: float, lo: float, hi: float) -> float:
-    return max(lo, min(hi, n))
+# Gaming expects more headroom.
+THRESHOLDS: Dict[str, Dict[str, float]] = {
+    "general": {
+        "ram_warn": 70, "ram_bad": 85,
+        "cpu_warn": 60, "cpu_bad": 85,
+        "disk_warn": 25, "disk_bad": 15,
+        "startup_warn": 7, "startup_bad": 12,
+    },
+    "gaming": {
+        "ram_warn": 60, "ram_bad": 75,
+        "cpu_warn": 50, "cpu_bad": 75,
+        "disk_warn": 30, "disk_bad": 20,
+        "startup_warn": 6, "startup_bad": 10,
+    },
+}
+
+def _score_numeric(cpu_pct: float, ram_used: float, disk_free_pct: float, startup_n: int, th: Tuple[float, ...]):
+    """Pure-numeric scoring core (numba-compatible).
+
+    Returns (score, penalties, levels) where penalties/levels are ordered
+    RAM, Disk, Startup, CPU and a level is 0 (ok), 1 (warn) or 2 (bad).
+    """
+    ram_warn, ram_bad, cpu_warn, cpu_bad, disk_warn, disk_bad, startup_warn, startup_bad = th
+
+    ram_p, ram_l = 0.0, 0
+    if ram_used >= ram_bad:
+        ram_p, ram_l = min(40.0, max(0.0, 25 + (ram_used - ram_bad) * 0.6)), 2
+    elif ram_used >= ram_warn:
+        ram_p, ram_l = min(40.0, max(0.0, 10 + (ram_used - ram_warn) * 0.4)), 1
+
+    disk_p, disk_l = 0.0, 0
+    if disk_free_pct <= disk_bad:
+        disk_p, disk_l = min(40.0, max(0.0, 25 + (disk_bad - disk_free_pct) * 0.8)), 2
+    elif disk_free_pct <= disk_warn:
+        disk_p, disk_l = min(40.0, max(0.0, 10 + (disk_warn - disk_free_pct) * 0.5)), 1
+
+    startup_p, startup_l = 0.0, 0
+    if startup_n >= startup_bad:
+        startup_p, startup_l = min(40.0, max(0.0, 18 + (startup_n - startup_bad) * 0.7)), 2
+    elif startup_n >= startup_warn:
+        startup_p, startup_l = min(40.0, max(0.0, 8 + (startup_n - startup_warn) * 0.8)), 1
+
+    cpu_p, cpu_l = 0.0, 0
+    if cpu_pct >= cpu_bad:
+        cpu_p, cpu_l = min(40.0, max(0.0, 18 + (cpu_pct - cpu_bad) * 0.5)), 2
+    elif cpu_pct >= cpu_warn:
+        cpu_p, cpu_l = min(40.0, max(0.0, 7 + (cpu_pct - cpu_warn) * 0.4)), 1
+
+    # Start at 100, subtract penalties (bounded)
+    score = 100.0 - ram_p - disk_p - startup_p - cpu_p
+    return (
+        min(100.0, max(0.0, score)),
+        (ram_p, disk_p, startup_p, cpu_p),
+        (ram_l, disk_l, startup_l, cpu_l),
+    )
+
+# (tag, (warn reason, bad reason)) in the order _score_numeric reports them.
+_REASONS = (
+    ("RAM", ("Moderate RAM pressure ({:.0f}%).", "High RAM pressure ({:.0f}%).")),
+    ("Disk", ("Low free disk space ({:.0f}%).", "Very low free disk space ({:.0f}%).")),
+    ("Startup", ("Several startup items ({}).", "Too many startup items ({}).")),
+    ("CPU", ("CPU moderately loaded ({:.0f}%).", "High CPU load at scan time ({:.0f}%).")),
+)
+
+# Swapped for a compiled version by activate_numba_scorer().
+_score_numeric_impl = _score_numeric
+
+def activate_numba_scorer() -> bool:
+    """JIT-compile the numeric scoring core with numba, if it is installed.
+
+    Worth it when scoring many scans in one process (e.g. fleet data);
+    returns False and keeps the pure-Python core when numba is unavailable.
+    """
+    global _score_numeric_impl
+    try:
+        import numba  # type: ignore
+    except Exception:
+        return False
+    _score_numeric_impl = numba.njit(cache=True)(_score_numeric)
+    return True
+
+def _compile_scorer(t: Dict[str, float]) -> Callable[[float, float, float, int], Tuple[float, List[Dict[str, Any]]]]:
+    """Bind one mode's thresholds into a specialised scoring closure."""
+    th = tuple(float(t[k]) for k in (
+        "ram_warn", "ram_bad", "cpu_warn", "cpu_bad",
+        "disk_warn", "disk_bad", "startup_warn", "startup_bad",
+    ))
+
+    def scorer(cpu_pct: float, ram_used: float, disk_free_pct: float, startup_n: int):
+        score, penalties, levels = _score_numeric_impl(cpu_pct, ram_used, disk_free_pct, startup_n, th)
+        values = (ram_used, disk_free_pct, startup_n, cpu_pct)
+        breakdown = [
+            {"tag": tag, "penalty": round(penalty, 1), "reason": templates[level - 1].format(value)}
+            for (tag, templates), penalty, level, value in zip(_REASONS, penalties, levels, values)
+            if level
+        ]
+        return score, breakdown
+
+    return scorer
+
+_SCORERS = {mode: _compile_scorer(t) for mode, t in THRESHOLDS.items()}
 
 def score_system(data: Dict[str, Any], mode: str = "general") -> Dict[str, Any]:
     """Return a performance score (0-100) with breakdown and notes.
@@ -32,55 +131,7 @@ def score_system(data: Dict[str, Any], mode: str = "general") -> Dict[str, Any]:
     free_pcts = [d.get("free_pct") for d in disks if d.get("free_pct") is not None]
     disk_free_pct = float(min(free_pcts)) if free_pcts else 100.0
 
-    # Thresholds
-    # Gaming expects more headroom.
-    ram_warn = 70 if not gaming else 60
-    ram_bad  = 85 if not gaming else 75
-
-    cpu_warn = 60 if not gaming else 50
-    cpu_bad  = 85 if not gaming else 75
-
-    disk_warn = 25 if not gaming else 30
-    disk_bad  = 15 if not gaming else 20
-
-    startup_warn = 7 if not gaming else 6
-    startup_bad  = 12 if not gaming else 10
-
-    # Start at 100, subtract penalties (bounded)
-    score = 100.0
-    breakdown: List[Dict[str, Any]] = []
-
-    def penalize(tag: str, penalty: float, reason: str):
-        nonlocal score
-        penalty = float(clamp(penalty, 0, 40))
-        score -= penalty
-        breakdown.append({"tag": tag, "penalty": round(penalty, 1), "reason": reason})
-
-    # RAM penalty
-    if ram_used >= ram_bad:
-        penalize("RAM", 25 + (ram_used - ram_bad) * 0.6, f"High RAM pressure ({ram_used:.0f}%).")
-    elif ram_used >= ram_warn:
-        penalize("RAM", 10 + (ram_used - ram_warn) * 0.4, f"Moderate RAM pressure ({ram_used:.0f}%).")
-
-    # Disk penalty
-    if disk_free_pct <= disk_bad:
-        penalize("Disk", 25 + (disk_bad - disk_free_pct) * 0.8, f"Very low free disk space ({disk_free_pct:.0f}%).")
-    elif disk_free_pct <= disk_warn:
-        penalize("Disk", 10 + (disk_warn - disk_free_pct) * 0.5, f"Low free disk space ({disk_free_pct:.0f}%).")
-
-    # Startup penalty
-    if startup_n >= startup_bad:
-        penalize("Startup", 18 + (startup_n - startup_bad) * 0.7, f"Too many startup items ({startup_n}).")
-    elif startup_n >= startup_warn:
-        penalize("Startup", 8 + (startup_n - startup_warn) * 0.8, f"Several startup items ({startup_n}).")
-
-    # CPU penalty
-    if cpu_pct >= cpu_bad:
-        penalize("CPU", 18 + (cpu_pct - cpu_bad) * 0.5, f"High CPU load at scan time ({cpu_pct:.0f}%).")
-    elif cpu_pct >= cpu_warn:
-        penalize("CPU", 7 + (cpu_pct - cpu_warn) * 0.4, f"CPU moderately loaded ({cpu_pct:.0f}%).")
-
-    score = clamp(score, 0, 100)
+    score, breakdown = _SCORERS["gaming" if gaming else "general"](cpu_pct, ram_used, disk_free_pct, startup_n)
 
     band = "Excellent" if score >= 85 else "Good" if score >= 70 else "Fair" if score >= 55 else "Poor"
     return {
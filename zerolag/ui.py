@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import os
+import queue
 import threading
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+from typing import List
 
 from .core import run_scan, save_json
 from .report import render_markdown, save_markdown, render_pdf
@@ -18,6 +20,8 @@ class ZeroLagApp(tk.Tk):
 
         self.data = None
         self.mode = tk.StringVar(value="gaming")
+        # Worker -> Tk thread messages: ("progress", str) | ("done", data) | ("error", exc)
+        self._queue: queue.Queue = queue.Queue()
 
         self._build()
 
@@ -84,13 +88,33 @@ class ZeroLagApp(tk.Tk):
 
         def task():
             try:
-                data = run_scan(mode=mode)
-                self.data = data
-                self.after(0, lambda: self.show_results(data))
+                self._queue.put(("progress", f"Scanning ({mode})…"))
+                self._queue.put(("done", run_scan(mode=mode)))
             except Exception as e:
-                self.after(0, lambda: self.on_error(e))
+                self._queue.put(("error", e))
 
         threading.Thread(target=task, daemon=True).start()
+        self.after(50, self._drain)
+
+    def _drain(self):
+        """Apply every pending worker message in one Tk callback."""
+        finished = False
+        while True:
+            try:
+                kind, payload = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progress":
+                self.status.set(payload)
+            elif kind == "done":
+                self.data = payload
+                self.show_results(payload)
+                finished = True
+            elif kind == "error":
+                self.on_error(payload)
+                finished = True
+        if not finished:
+            self.after(50, self._drain)
 
     def on_error(self, e: Exception):
         self.status.set("Error.")
@@ -108,55 +132,61 @@ class ZeroLagApp(tk.Tk):
         score = data.get("score") or {}
 
         self.score_label.set(f"Performance Score: {score.get('score','?')} / 100  ({score.get('band','')})")
-        self._write("=== Score ===\n")
-        self._write(f"Mode: {data.get('mode','general')}\n")
-        self._write(f"Performance Score: {score.get('score','?')} / 100  ({score.get('band','')})\n\n")
+
+        # Collected and inserted once so Tk lays the widget out a single time.
+        parts: List[str] = []
+        out = parts.append
+        out("=== Score ===\n")
+        out(f"Mode: {data.get('mode','general')}\n")
+        out(f"Performance Score: {score.get('score','?')} / 100  ({score.get('band','')})\n\n")
 
         bd = score.get("breakdown") or []
         if bd:
-            self._write("Breakdown:\n")
+            out("Breakdown:\n")
             for b in bd:
-                self._write(f"- {b.get('tag','')}: -{b.get('penalty','')}  ({b.get('reason','')})\n")
-            self._write("\n")
+                out(f"- {b.get('tag','')}: -{b.get('penalty','')}  ({b.get('reason','')})\n")
+            out("\n")
 
-        self._write("=== System ===\n")
-        self._write(f"Generated: {sys.get('timestamp','')}\n")
-        self._write(f"OS: {sys.get('os','')}\n")
-        self._write(f"Machine: {sys.get('machine','')}\n")
-        self._write(f"CPU: {sys.get('processor') or 'Unknown'}\n\n")
+        out("=== System ===\n")
+        out(f"Generated: {sys.get('timestamp','')}\n")
+        out(f"OS: {sys.get('os','')}\n")
+        out(f"Machine: {sys.get('machine','')}\n")
+        out(f"CPU: {sys.get('processor') or 'Unknown'}\n\n")
 
-        self._write("=== Snapshot ===\n")
-        self._write(f"CPU load: {cpu.get('cpu_pct','?')}%\n")
-        self._write(f"RAM used: {ram.get('used_pct','?')}% (Total {ram.get('total_gb','?')} GB)\n")
-        self._write(f"Cores: {cpu.get('physical_cores','?')} physical / {cpu.get('logical_cores','?')} logical\n\n")
+        out("=== Snapshot ===\n")
+        out(f"CPU load: {cpu.get('cpu_pct','?')}%\n")
+        out(f"RAM used: {ram.get('used_pct','?')}% (Total {ram.get('total_gb','?')} GB)\n")
+        out(f"Cores: {cpu.get('physical_cores','?')} physical / {cpu.get('logical_cores','?')} logical\n\n")
 
-        self._write("=== Storage ===\n")
+        out("=== Storage ===\n")
         if disks:
             for d in disks:
-                self._write(
+                out(
                     f"{d.get('mountpoint','')}: {d.get('free_gb','?')} GB free "
                     f"({d.get('free_pct','?')}%) of {d.get('total_gb','?')} GB\n"
                 )
         else:
-            self._write("No disk info available.\n")
-        self._write("\n")
+            out("No disk info available.\n")
+        out("\n")
 
-        self._write("=== Startup items ===\n")
-        self._write(f"Found: {len(startup)} items (common registry locations)\n\n")
+        out("=== Startup items ===\n")
+        out(f"Found: {len(startup)} items (common registry locations)\n\n")
 
-        self._write("=== Top processes ===\n")
+        out("=== Top processes ===\n")
         for p in procs[:8]:
-            self._write(
+            out(
                 f"{p.get('name','')}: CPU {p.get('cpu_pct','?')}% | "
                 f"RAM {p.get('ram_gb','?')} GB | PID {p.get('pid','')}\n"
             )
-        self._write("\n")
+        out("\n")
 
-        self._write("=== Recommendations ===\n")
+        out("=== Recommendations ===\n")
         for r in recs[:12]:
-            self._write(f"[{r.get('priority','Low')}] {r.get('title','')}\n")
-            self._write(f"  Why: {r.get('why','')}\n")
-            self._write(f"  Action: {r.get('action','')}\n\n")
+            out(f"[{r.get('priority','Low')}] {r.get('title','')}\n")
+            out(f"  Why: {r.get('why','')}\n")
+            out(f"  Action: {r.get('action','')}\n\n")
+
+        self._write("".join(parts))
 
         self.status.set("Scan complete.")
         self.btn_scan.config(state="normal")